@@ -7,16 +7,37 @@ through the py4cytoscape Python library.
 """
 
 import asyncio
-import json
+import atexit
+import concurrent.futures
+import contextlib
+import functools
+import importlib
+import importlib.util
+import inspect
+import os
+import queue
 import sys
-from typing import Any, Dict, List, Optional, Union
+import threading
+import time
+from types import ModuleType
+from typing import Any, Awaitable, Callable, Dict, Iterator, List, NamedTuple, Optional, Tuple, TypeVar, Union, cast
 import logging
+from logging.handlers import QueueHandler, QueueListener
+
+import fastjsonschema
+import orjson
+import requests
+from requests.adapters import HTTPAdapter
 
-try:
-    import py4cytoscape as p4c
-except ImportError:
-    print("Error: py4cytoscape not installed. Install with: pip install py4cytoscape", file=sys.stderr)
-    sys.exit(1)
+# py4cytoscape (and the pandas stack it pulls in) is imported on first use
+# through the p4c proxy defined below, keeping server start-up fast
+
+# Arrow-backed strings keep node/edge columns in contiguous buffers; only
+# probe for pyarrow here, pandas imports it when the dtype is first used
+if importlib.util.find_spec("pyarrow") is not None:
+    _STRING_DTYPE: Optional[str] = "string[pyarrow]"
+else:
+    _STRING_DTYPE = None
 
 from mcp.server.models import InitializationOptions
 from mcp.server import NotificationOptions, Server
@@ -31,36 +52,815 @@ from mcp.types import (
 import mcp.types as types
 
 # Configure logging
-import os
-log_file = os.path.join(os.path.expanduser("~"), "cytoscape-mcp.log")
-
-# Only log to file to avoid interfering with MCP JSON protocol over stdio
-logging.basicConfig(
-    level=logging.DEBUG,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler(log_file, mode='a')  # Only file logging
-    ]
-)
+# Only log to file to avoid interfering with MCP JSON protocol over stdio.
+# File logging is opt-in via CYTO_MCP_LOG so per-request spawns skip the file open.
+# Records are queued and written by a background listener thread, so file
+# I/O never blocks the event loop.
+_log_listener: Optional[QueueListener] = None
+if os.environ.get("CYTO_MCP_LOG"):
+    log_file = os.path.join(os.path.expanduser("~"), "cytoscape-mcp.log")
+    file_handler = logging.FileHandler(log_file, mode='a')  # Only file logging
+    file_handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
+    log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(-1)
+    logging.basicConfig(level=logging.DEBUG, format='%(message)s', handlers=[QueueHandler(log_queue)])
+    _log_listener = QueueListener(log_queue, file_handler, respect_handler_level=True)
+    _log_listener.start()
+else:
+    logging.basicConfig(level=logging.WARNING, handlers=[logging.NullHandler()])
 logger = logging.getLogger("cytoscape-mcp")
 
+
+def _stop_log_listener() -> None:
+    """Write out any queued log records and stop the listener thread"""
+    global _log_listener
+    if _log_listener is not None:
+        _log_listener.stop()
+        _log_listener = None
+
+
+atexit.register(_stop_log_listener)
+
 # Suppress other loggers that might interfere with stdio
 logging.getLogger("urllib3").setLevel(logging.WARNING)
 logging.getLogger("mcp").setLevel(logging.INFO)
 
-# Force log flushing
-for handler in logger.handlers:
-    handler.setLevel(logging.DEBUG)
-    if hasattr(handler, 'flush'):
-        handler.flush()
+# How long a cached Cytoscape version lookup stays valid, in seconds
+VERSION_INFO_TTL = 60.0
+
+# How long repeated STRING/NDEx imports are answered from cache, in seconds
+IMPORT_CACHE_TTL = 300.0
+
+# Maximum number of CyREST calls in flight at once; CyREST handles little parallelism
+CYREST_MAX_WORKERS = 4
+
+# Seconds between progress notifications for long-running tools
+PROGRESS_INTERVAL = 0.5
+
+# Node selections larger than this are sent to CyREST in chunks of this size
+SELECT_CHUNK_SIZE = 1000
+
+# Results with more items than this are serialized off the event loop
+OFFLOAD_DUMPS_MIN_ITEMS = 1000
+
+# Networks with more edges than this are sent to Cytoscape in one JSON request
+BULK_EDGE_THRESHOLD = 500
+
+# Largest text part, in characters, for responses split across several TextContents
+RESPONSE_CHUNK_CHARS = 64 * 1024
+
+_T = TypeVar("_T")
+
+_PING_OK_TEMPLATE = "Cytoscape is running. Version info: {}"
+
+# Layouts that ship with Cytoscape; other names are checked against the
+# layouts the running Cytoscape (including installed apps) reports
+_CORE_LAYOUTS = frozenset({
+    "attribute-circle", "attributes-layout", "circular", "cose", "degree-circle",
+    "force-directed", "force-directed-cl", "fruchterman-rheingold", "grid",
+    "hierarchical", "isom", "kamada-kawai", "stacked-node-layout",
+})
+
+# Tool definitions advertised to MCP clients; built once at import
+_TOOLS = [
+    Tool(
+        name="cytoscape_ping",
+        description="Check if Cytoscape is running and accessible",
+        inputSchema={
+            "type": "object",
+            "properties": {},
+            "required": []
+        }
+    ),
+    Tool(
+        name="create_network",
+        description="Create a new network from nodes and edges",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "nodes": {
+                    "type": "array",
+                    "description": "List of node names",
+                    "items": {"type": "string"}
+                },
+                "edges": {
+                    "type": "array", 
+                    "description": "List of edge tuples [source, target] or [source, target, interaction]",
+                    "items": {
+                        "type": "array",
+                        "minItems": 2,
+                        "maxItems": 3
+                    }
+                },
+                "title": {
+                    "type": "string",
+                    "description": "Network title",
+                    "default": "New Network"
+                },
+                "collection": {
+                    "type": "string", 
+                    "description": "Collection name",
+                    "default": "My Collection"
+                }
+            },
+            "required": ["nodes", "edges"]
+        }
+    ),
+    Tool(
+        name="load_network_file",
+        description="Load a network from file (SIF, GraphML, XGMML, etc.). File format is auto-detected by Cytoscape.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "file_path": {
+                    "type": "string",
+                    "description": "Path to network file"
+                }
+            },
+            "required": ["file_path"]
+        }
+    ),
+    Tool(
+        name="get_network_list",
+        description="Get list of all networks in current session",
+        inputSchema={
+            "type": "object",
+            "properties": {},
+            "required": []
+        }
+    ),
+    Tool(
+        name="get_network_info",
+        description="Get detailed information about a network",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "network": {
+                    "type": ["string", "integer"],
+                    "description": "Network name, SUID, or current network if not specified"
+                }
+            },
+            "required": []
+        }
+    ),
+    Tool(
+        name="select_nodes",
+        description="Select nodes in the network",
+        inputSchema={
+            "type": "object", 
+            "properties": {
+                "nodes": {
+                    "type": "array",
+                    "description": "List of node names or SUIDs to select",
+                    "items": {"type": ["string", "integer"]}
+                },
+                "by_col": {
+                    "type": "string",
+                    "description": "Column name to select by",
+                    "default": "name"
+                },
+                "network": {
+                    "type": ["string", "integer"],
+                    "description": "Network name or SUID"
+                }
+            },
+            "required": ["nodes"]
+        }
+    ),
+    Tool(
+        name="apply_layout",
+        description="Apply a layout algorithm to the network",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "layout_name": {
+                    "type": "string",
+                    "description": "Layout algorithm name (e.g., 'force-directed', 'circular', 'hierarchical')",
+                    "default": "force-directed"
+                },
+                "network": {
+                    "type": ["string", "integer"], 
+                    "description": "Network name or SUID"
+                }
+            },
+            "required": []
+        }
+    ),
+    Tool(
+        name="set_visual_style",
+        description="Apply a visual style to the network",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "style_name": {
+                    "type": "string",
+                    "description": "Visual style name"
+                },
+                "network": {
+                    "type": ["string", "integer"],
+                    "description": "Network name or SUID" 
+                }
+            },
+            "required": ["style_name"]
+        }
+    ),
+    Tool(
+        name="export_image",
+        description="Export network view as image",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "filename": {
+                    "type": "string", 
+                    "description": "Output filename with extension (PNG, JPG, PDF, SVG)"
+                },
+                "type": {
+                    "type": "string",
+                    "description": "Image format",
+                    "enum": ["PNG", "JPG", "PDF", "SVG"],
+                    "default": "PNG"
+                },
+                "resolution": {
+                    "type": "integer",
+                    "description": "Image resolution (DPI)",
+                    "default": 300
+                },
+                "network": {
+                    "type": ["string", "integer"],
+                    "description": "Network name or SUID"
+                }
+            },
+            "required": ["filename"]
+        }
+    ),
+    Tool(
+        name="run_app_command", 
+        description="Execute a Cytoscape app command",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "command": {
+                    "type": "string",
+                    "description": "Command string; separate multiple commands with newlines"
+                },
+                "network": {
+                    "type": ["string", "integer"],
+                    "description": "Network context"
+                }
+            },
+            "required": ["command"]
+        }
+    ),
+    Tool(
+        name="load_string_network",
+        description="Load protein interaction network from STRING database",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "protein_query": {
+                    "type": "string", 
+                    "description": "Protein names/IDs (comma-separated)"
+                },
+                "species": {
+                    "type": "integer",
+                    "description": "NCBI taxonomy ID (e.g., 9606 for human)",
+                    "default": 9606
+                },
+                "confidence_score": {
+                    "type": "number",
+                    "description": "Confidence threshold (0.0-1.0)",
+                    "default": 0.4
+                },
+                "network_type": {
+                    "type": "string", 
+                    "description": "STRING network type",
+                    "enum": ["functional", "physical"],
+                    "default": "functional"
+                }
+            },
+            "required": ["protein_query"]
+        }
+    ),
+    Tool(
+        name="import_network_from_ndex",
+        description="Import a network from the NDEx database into Cytoscape",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "ndex_id": {
+                    "type": "string",
+                    "description": "Network external ID provided by NDEx (not Cytoscape SUID)"
+                },
+                "username": {
+                    "type": "string",
+                    "description": "NDEx account username (required for private content)"
+                },
+                "password": {
+                    "type": "string",
+                    "description": "NDEx account password (required for private content)"
+                },
+                "access_key": {
+                    "type": "string",
+                    "description": "NDEx access key (alternative to username/password)"
+                },
+                "ndex_url": {
+                    "type": "string",
+                    "description": "NDEx website URL",
+                    "default": "http://ndexbio.org"
+                }
+            },
+            "required": ["ndex_id"]
+        }
+    ),
+    Tool(
+        name="export_network_to_ndex",
+        description="Export current network to NDEx database",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "username": {
+                    "type": "string",
+                    "description": "NDEx account username"
+                },
+                "password": {
+                    "type": "string",
+                    "description": "NDEx account password"
+                },
+                "is_public": {
+                    "type": "boolean",
+                    "description": "Whether to make the network publicly accessible",
+                    "default": False
+                },
+                "network": {
+                    "type": ["string", "integer"],
+                    "description": "Network name or SUID (current network if not specified)"
+                },
+                "metadata": {
+                    "type": "object",
+                    "description": "Network metadata (name, description, version, etc.)",
+                    "properties": {
+                        "name": {"type": "string", "description": "Network name"},
+                        "description": {"type": "string", "description": "Network description"},
+                        "version": {"type": "string", "description": "Network version"},
+                        "author": {"type": "string", "description": "Author name"}
+                    }
+                },
+                "ndex_url": {
+                    "type": "string",
+                    "description": "NDEx website URL",
+                    "default": "http://ndexbio.org"
+                }
+            },
+            "required": ["username", "password"]
+        }
+    ),
+    Tool(
+        name="get_network_ndex_id",
+        description="Get the NDEx external ID for a Cytoscape network",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "network": {
+                    "type": ["string", "integer"],
+                    "description": "Network name or SUID (current network if not specified)"
+                }
+            },
+            "required": []
+        }
+    ),
+    Tool(
+        name="update_network_in_ndex",
+        description="Update an existing network in NDEx",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "username": {
+                    "type": "string",
+                    "description": "NDEx account username"
+                },
+                "password": {
+                    "type": "string",
+                    "description": "NDEx account password"
+                },
+                "is_public": {
+                    "type": "boolean",
+                    "description": "Whether to make the network publicly accessible",
+                    "default": False
+                },
+                "network": {
+                    "type": ["string", "integer"],
+                    "description": "Network name or SUID (current network if not specified)"
+                },
+                "metadata": {
+                    "type": "object",
+                    "description": "Updated network metadata",
+                    "properties": {
+                        "name": {"type": "string", "description": "Network name"},
+                        "description": {"type": "string", "description": "Network description"},
+                        "version": {"type": "string", "description": "Network version"},
+                        "author": {"type": "string", "description": "Author name"}
+                    }
+                },
+                "ndex_url": {
+                    "type": "string",
+                    "description": "NDEx website URL",
+                    "default": "http://ndexbio.org"
+                }
+            },
+            "required": ["username", "password"]
+        }
+    ),
+    Tool(
+        name="invalidate_ndex_cache",
+        description="Forget cached NDEx IDs and NDEx imports so the next lookups go to Cytoscape",
+        inputSchema={
+            "type": "object",
+            "properties": {},
+            "required": []
+        }
+    )
+]
+
+# Input validators compiled once from the tool schemas
+_VALIDATORS = {
+    tool.name: fastjsonschema.compile(tool.inputSchema, use_default=False) for tool in _TOOLS
+}
+
+
+def _text(msg: str) -> List[TextContent]:
+    """Wrap a message as a single-item text response"""
+    return [TextContent(type="text", text=msg)]
+
+
+@functools.lru_cache(maxsize=128)
+def _text_content(msg: str) -> TextContent:
+    return TextContent(type="text", text=msg)
+
+
+def _const_text(msg: str) -> List[TextContent]:
+    """Like _text, for messages that repeat; the TextContent is built once and reused"""
+    return [_text_content(msg)]
+
+
+def _dumps(obj: Any) -> str:
+    """Serialize a tool result as indented JSON text"""
+    return orjson.dumps(
+        obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+    ).decode()
+
+
+def _chunked_text(header: str, result: Any) -> List[TextContent]:
+    """Render a result as text parts of at most RESPONSE_CHUNK_CHARS each
+
+    Dicts are written one compact ``key: value`` line per entry, so a large
+    payload is never encoded as one indented document. A single line longer
+    than the limit gets a part of its own; the header goes out alone when
+    it does not fit with the first line.
+    """
+    if not isinstance(result, dict):
+        return _text(f"{header} {_dumps(result)}")
+    parts = []
+    lines = [header]
+    size = len(header)
+    for key, value in result.items():
+        line = f"{key}: {orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY).decode()}"
+        if size + 1 + len(line) > RESPONSE_CHUNK_CHARS:
+            parts.append(TextContent(type="text", text="\n".join(lines)))
+            lines = []
+        size = size + 1 + len(line) if lines else len(line)
+        lines.append(line)
+    parts.append(TextContent(type="text", text="\n".join(lines)))
+    return parts
+
+
+def _commands_run_all(commands: List[str]) -> List[Any]:
+    """Run several Cytoscape commands in sequence, collecting each result"""
+    return [p4c.commands_run(cmd_string=command) for command in commands]
+
+
+def _create_from_data_frames(nodes: List[str], edges: List[List], title: str, collection: str) -> int:
+    """Create a network through pandas DataFrames; returns its SUID
+
+    Runs in a CyREST worker, so the first pandas import never blocks the
+    event loop. 2-item edges get a default interaction.
+    """
+    import pandas as pd
+
+    nodes_df = pd.DataFrame({'id': nodes})
+    edges_df = pd.DataFrame(edges).reindex(columns=range(3))
+    edges_df.columns = ['source', 'target', 'interaction']
+    edges_df['interaction'] = edges_df['interaction'].fillna("interacts")
+    if _STRING_DTYPE:
+        nodes_df = nodes_df.astype(_STRING_DTYPE)
+        edges_df = edges_df.astype(_STRING_DTYPE)
+    return int(p4c.create_network_from_data_frames(
+        nodes=nodes_df, edges=edges_df, title=title, collection=collection
+    ))
+
+
+def _post_network(nodes: List[str], edges: List[List], title: str, collection: str) -> int:
+    """Create a network from cytoscape.js JSON in one CyREST call; returns its SUID
+
+    This is the request create_network_from_data_frames sends, without its
+    follow-up table loads, so ``title`` and ``collection`` behave the same.
+    2-item edges get a default interaction.
+    """
+    json_edges = []
+    for edge in edges:
+        source, target = edge[0], edge[1]
+        interaction = edge[2] if len(edge) > 2 else "interacts"
+        json_edges.append({"data": {
+            "name": f"{source} ({interaction}) {target}",
+            "source": source,
+            "target": target,
+            "interaction": interaction,
+        }})
+    body = {
+        "data": [{"name": title}],
+        "elements": {"nodes": [{"data": {"id": node}} for node in nodes], "edges": json_edges},
+    }
+    result = p4c.commands.cyrest_post(
+        "networks", parameters={"title": title, "collection": collection}, body=body
+    )
+    return int(result["networkSUID"])
+
+
+_ToolMethod = Callable[..., Awaitable[List[TextContent]]]
+
+
+def _tool_handler(
+    fail_msg: str, hint: str = "", success: Optional[str] = None
+) -> Callable[[Callable[..., Awaitable[_T]]], _ToolMethod]:
+    """Report exceptions raised by a tool handler as a text response
+
+    With a ``success`` template the handler returns its raw result, and the
+    text response is ``success`` formatted with ``result`` and the call's
+    arguments. Either way the decorated method returns ``List[TextContent]``.
+    """
+    def decorator(func: Callable[..., Awaitable[_T]]) -> _ToolMethod:
+        # Parameter names and defaults after ``self``, read once per handler
+        params = list(inspect.signature(func).parameters.values())[1:]
+        names = [param.name for param in params]
+        defaults = {
+            param.name: param.default for param in params if param.default is not param.empty
+        }
+
+        @functools.wraps(func)
+        async def wrapper(self: Any, *args: Any, **kwargs: Any) -> List[TextContent]:
+            try:
+                result = await func(self, *args, **kwargs)
+                if success is None:
+                    return cast(List[TextContent], result)
+                arguments = {**defaults, **dict(zip(names, args)), **kwargs}
+                return _text(success.format(result=result, **arguments))
+            except Exception as e:
+                logger.exception(fail_msg)
+                return _text(f"{fail_msg}: {e}{hint}")
+        return wrapper
+    return decorator
+
+
+class _TTLCache:
+    """Small dict cache whose entries expire ``ttl`` seconds after being set"""
+
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        self._entries: Dict[Any, Tuple[float, Any]] = {}
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        entry = self._entries.get(key)
+        if entry is None:
+            return default
+        expires_at, value = entry
+        if time.monotonic() >= expires_at:
+            del self._entries[key]
+            return default
+        return value
+
+    def set(self, key: Any, value: Any) -> None:
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+class _NdexImportParams(NamedTuple):
+    """Arguments for ``p4c.import_network_from_ndex``
+
+    Credentials are either a username/password pair or an access key; unset
+    fields are left out of the call.
+    """
+
+    ndex_id: str
+    ndex_url: str
+    username: Optional[str] = None
+    password: Optional[str] = None
+    access_key: Optional[str] = None
+
+    def kwargs(self) -> Dict[str, Any]:
+        return {k: v for k, v in zip(self._fields, self) if v}
+
+
+class _SessionRequests:
+    """Stand-in for the ``requests`` module that sends through one pooled session
+
+    py4cytoscape issues every CyREST call with ``requests.request()``, which
+    opens and tears down a fresh connection each time.
+    """
+
+    def __init__(self, session: requests.Session):
+        self.session = session
+
+    def request(self, method: str, url: str, **kwargs: Any) -> requests.Response:
+        return self.session.request(method, url, **kwargs)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(requests, name)
+
+
+def _new_cyrest_session() -> requests.Session:
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=8, pool_maxsize=16)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+# Keep-alive session shared by py4cytoscape and direct CyREST requests
+_CYREST_SESSION = _new_cyrest_session()
+
+
+def _install_cyrest_session(module: Any) -> None:
+    """Make py4cytoscape reuse the keep-alive session for all CyREST calls"""
+    commands = module.commands
+    if not isinstance(commands.requests, _SessionRequests):
+        commands.requests = _SessionRequests(_CYREST_SESSION)
+
+
+class _LazyModule:
+    """Stand-in for a module that is imported on first attribute access
+
+    ``on_load`` runs once with the freshly imported module.
+    """
+
+    def __init__(self, name: str, on_load: Optional[Any] = None):
+        self._name = name
+        self._on_load = on_load
+        self._module: Optional[ModuleType] = None
+        self._lock = threading.Lock()
+
+    def _load(self) -> ModuleType:
+        with self._lock:
+            if self._module is not None:
+                return self._module
+            try:
+                module = importlib.import_module(self._name)
+            except ImportError as e:
+                raise ImportError(
+                    f"{self._name} not installed. Install with: pip install {self._name}"
+                ) from e
+            if self._on_load is not None:
+                self._on_load(module)
+            self._module = module
+            return module
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._module or self._load(), name)
+
+
+p4c = _LazyModule("py4cytoscape", on_load=_install_cyrest_session)
+
 
 class CytoscapeMCPServer:
-    def __init__(self):
-        logger.info("Initializing CytoscapeMCPServer...")
-        self.server = Server("cytoscape-mcp")
-        logger.info("Server instance created")
+    def __init__(self) -> None:
+        logger.debug("Initializing CytoscapeMCPServer...")
+        self.server: Server[Any, Any] = Server("cytoscape-mcp")
+        self.http_session = _CYREST_SESSION
+        self._cyrest_pool = concurrent.futures.ThreadPoolExecutor(
+            max_workers=CYREST_MAX_WORKERS, thread_name_prefix="cyrest"
+        )
+        self._version_cache = _TTLCache(VERSION_INFO_TTL)
+        self._string_cache = _TTLCache(IMPORT_CACHE_TTL)
+        self._ndex_cache = _TTLCache(IMPORT_CACHE_TTL)
+        self._network_suids: Dict[str, int] = {}
+        # NDEx ID per network SUID, as last seen by this server
+        self._ndex_ids: Dict[int, Optional[str]] = {}
+        self._dispatch: Dict[str, _ToolMethod] = {
+            "cytoscape_ping": self._ping_cytoscape,
+            "create_network": self._create_network,
+            "load_network_file": self._load_network_file,
+            "get_network_list": self._get_network_list,
+            "get_network_info": self._get_network_info,
+            "select_nodes": self._select_nodes,
+            "apply_layout": self._apply_layout,
+            "set_visual_style": self._set_visual_style,
+            "export_image": self._export_image,
+            "run_app_command": self._run_app_command,
+            "load_string_network": self._load_string_network,
+            "import_network_from_ndex": self._import_network_from_ndex,
+            "export_network_to_ndex": self._export_network_to_ndex,
+            "get_network_ndex_id": self._get_network_ndex_id,
+            "update_network_in_ndex": self._update_network_in_ndex,
+            "invalidate_ndex_cache": self._invalidate_ndex_cache,
+        }
         self.setup_handlers()
-        logger.info("Handlers setup complete")
+        logger.debug("Handlers setup complete")
+
+    async def _run_p4c(self, func: Callable[..., _T], *args: Any, **kwargs: Any) -> _T:
+        """Run a blocking py4cytoscape call in the bounded CyREST worker pool"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._cyrest_pool, functools.partial(func, *args, **kwargs)
+        )
+
+    async def _resolve_network(
+        self, network: Optional[Union[str, int]]
+    ) -> Optional[Union[str, int]]:
+        """Translate a network name to its SUID, remembering earlier lookups"""
+        if not isinstance(network, str) or network == "current":
+            return network
+        suid = self._network_suids.get(network)
+        if suid is None:
+            suid = self._network_suids[network] = await self._run_p4c(
+                p4c.get_network_suid, title=network
+            )
+        return suid
+
+    def _forget_network(self, network: Optional[Union[str, int]]) -> None:
+        """Drop the SUID cached for a network name, if any"""
+        if isinstance(network, str):
+            self._network_suids.pop(network, None)
+
+    @contextlib.contextmanager
+    def _forget_network_on_error(self, network: Optional[Union[str, int]]) -> Iterator[None]:
+        """Forget a network name's cached SUID if the enclosed calls fail
+
+        The SUID may belong to a network that has since been closed or
+        renamed, so the name is looked up afresh on the next call.
+        """
+        try:
+            yield
+        except Exception:
+            self._forget_network(network)
+            raise
+
+    async def _with_progress(self, call: Awaitable[Any]) -> Any:
+        """Await a long-running call, reporting progress if the client asked for it
+
+        Cancelling the tool call stops the wait; the CyREST request itself runs
+        to completion in its worker thread.
+        """
+        try:
+            ctx = self.server.request_context
+        except LookupError:
+            return await call
+        token = ctx.meta.progressToken if ctx.meta else None
+        if token is None:
+            return await call
+
+        task = asyncio.ensure_future(call)
+        ticks = 0
+        try:
+            while True:
+                done, _ = await asyncio.wait({task}, timeout=PROGRESS_INTERVAL)
+                if done:
+                    return task.result()
+                ticks += 1
+                await ctx.session.send_progress_notification(token, progress=ticks, total=None)
+        finally:
+            task.cancel()
+
+    def _cyrest_get_raw(self, operation: str) -> str:
+        """GET a CyREST endpoint and return its JSON body as-is, without decoding it"""
+        url = p4c.commands.build_url(p4c.commands.DEFAULT_BASE_URL, operation)
+        response = self.http_session.get(url)
+        response.raise_for_status()
+        return response.content.decode()
+
+    async def _network_exists(self, suid: int) -> bool:
+        """Check that a network imported earlier is still in the session"""
+        try:
+            await self._run_p4c(p4c.get_network_suid, title=suid)
+        except Exception:
+            return False
+        return True
+
+    def _forget_imports(self) -> None:
+        """Drop cached STRING/NDEx imports; a newer network may reuse their titles"""
+        self._string_cache.clear()
+        self._ndex_cache.clear()
+
+    def _forget_networks(self) -> None:
+        """Drop cached network lookups and imports that may no longer exist"""
+        self._network_suids.clear()
+        self._forget_imports()
+        self._ndex_ids.clear()
+
+    async def _dumps_async(self, obj: Any) -> str:
+        """Serialize a possibly large result without blocking the event loop"""
+        if not hasattr(obj, '__len__') or len(obj) <= OFFLOAD_DUMPS_MIN_ITEMS:
+            return _dumps(obj)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, _dumps, obj)
         
     def setup_handlers(self):
         """Setup MCP message handlers"""
@@ -69,605 +869,194 @@ class CytoscapeMCPServer:
         @self.server.list_tools()
         async def handle_list_tools() -> List[Tool]:
             """List available Cytoscape tools"""
-            return [
-                Tool(
-                    name="cytoscape_ping",
-                    description="Check if Cytoscape is running and accessible",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {},
-                        "required": []
-                    }
-                ),
-                Tool(
-                    name="create_network",
-                    description="Create a new network from nodes and edges",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "nodes": {
-                                "type": "array",
-                                "description": "List of node names",
-                                "items": {"type": "string"}
-                            },
-                            "edges": {
-                                "type": "array", 
-                                "description": "List of edge tuples [source, target] or [source, target, interaction]",
-                                "items": {
-                                    "type": "array",
-                                    "minItems": 2,
-                                    "maxItems": 3
-                                }
-                            },
-                            "title": {
-                                "type": "string",
-                                "description": "Network title",
-                                "default": "New Network"
-                            },
-                            "collection": {
-                                "type": "string", 
-                                "description": "Collection name",
-                                "default": "My Collection"
-                            }
-                        },
-                        "required": ["nodes", "edges"]
-                    }
-                ),
-                Tool(
-                    name="load_network_file",
-                    description="Load a network from file (SIF, GraphML, XGMML, etc.). File format is auto-detected by Cytoscape.",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "file_path": {
-                                "type": "string",
-                                "description": "Path to network file"
-                            }
-                        },
-                        "required": ["file_path"]
-                    }
-                ),
-                Tool(
-                    name="get_network_list",
-                    description="Get list of all networks in current session",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {},
-                        "required": []
-                    }
-                ),
-                Tool(
-                    name="get_network_info",
-                    description="Get detailed information about a network",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "network": {
-                                "type": ["string", "integer"],
-                                "description": "Network name, SUID, or current network if not specified"
-                            }
-                        },
-                        "required": []
-                    }
-                ),
-                Tool(
-                    name="select_nodes",
-                    description="Select nodes in the network",
-                    inputSchema={
-                        "type": "object", 
-                        "properties": {
-                            "nodes": {
-                                "type": "array",
-                                "description": "List of node names or SUIDs to select",
-                                "items": {"type": ["string", "integer"]}
-                            },
-                            "by_col": {
-                                "type": "string",
-                                "description": "Column name to select by",
-                                "default": "name"
-                            },
-                            "network": {
-                                "type": ["string", "integer"],
-                                "description": "Network name or SUID"
-                            }
-                        },
-                        "required": ["nodes"]
-                    }
-                ),
-                Tool(
-                    name="apply_layout",
-                    description="Apply a layout algorithm to the network",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "layout_name": {
-                                "type": "string",
-                                "description": "Layout algorithm name (e.g., 'force-directed', 'circular', 'hierarchical')",
-                                "default": "force-directed"
-                            },
-                            "network": {
-                                "type": ["string", "integer"], 
-                                "description": "Network name or SUID"
-                            }
-                        },
-                        "required": []
-                    }
-                ),
-                Tool(
-                    name="set_visual_style",
-                    description="Apply a visual style to the network",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "style_name": {
-                                "type": "string",
-                                "description": "Visual style name"
-                            },
-                            "network": {
-                                "type": ["string", "integer"],
-                                "description": "Network name or SUID" 
-                            }
-                        },
-                        "required": ["style_name"]
-                    }
-                ),
-                Tool(
-                    name="export_image",
-                    description="Export network view as image",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "filename": {
-                                "type": "string", 
-                                "description": "Output filename with extension (PNG, JPG, PDF, SVG)"
-                            },
-                            "type": {
-                                "type": "string",
-                                "description": "Image format",
-                                "enum": ["PNG", "JPG", "PDF", "SVG"],
-                                "default": "PNG"
-                            },
-                            "resolution": {
-                                "type": "integer",
-                                "description": "Image resolution (DPI)",
-                                "default": 300
-                            },
-                            "network": {
-                                "type": ["string", "integer"],
-                                "description": "Network name or SUID"
-                            }
-                        },
-                        "required": ["filename"]
-                    }
-                ),
-                Tool(
-                    name="run_app_command", 
-                    description="Execute a Cytoscape app command",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "command": {
-                                "type": "string",
-                                "description": "Command string"
-                            },
-                            "network": {
-                                "type": ["string", "integer"],
-                                "description": "Network context"
-                            }
-                        },
-                        "required": ["command"]
-                    }
-                ),
-                Tool(
-                    name="load_string_network",
-                    description="Load protein interaction network from STRING database",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "protein_query": {
-                                "type": "string", 
-                                "description": "Protein names/IDs (comma-separated)"
-                            },
-                            "species": {
-                                "type": "integer",
-                                "description": "NCBI taxonomy ID (e.g., 9606 for human)",
-                                "default": 9606
-                            },
-                            "confidence_score": {
-                                "type": "number",
-                                "description": "Confidence threshold (0.0-1.0)",
-                                "default": 0.4
-                            },
-                            "network_type": {
-                                "type": "string", 
-                                "description": "STRING network type",
-                                "enum": ["functional", "physical"],
-                                "default": "functional"
-                            }
-                        },
-                        "required": ["protein_query"]
-                    }
-                ),
-                Tool(
-                    name="import_network_from_ndex",
-                    description="Import a network from the NDEx database into Cytoscape",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "ndex_id": {
-                                "type": "string",
-                                "description": "Network external ID provided by NDEx (not Cytoscape SUID)"
-                            },
-                            "username": {
-                                "type": "string",
-                                "description": "NDEx account username (required for private content)"
-                            },
-                            "password": {
-                                "type": "string",
-                                "description": "NDEx account password (required for private content)"
-                            },
-                            "access_key": {
-                                "type": "string",
-                                "description": "NDEx access key (alternative to username/password)"
-                            },
-                            "ndex_url": {
-                                "type": "string",
-                                "description": "NDEx website URL",
-                                "default": "http://ndexbio.org"
-                            }
-                        },
-                        "required": ["ndex_id"]
-                    }
-                ),
-                Tool(
-                    name="export_network_to_ndex",
-                    description="Export current network to NDEx database",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "username": {
-                                "type": "string",
-                                "description": "NDEx account username"
-                            },
-                            "password": {
-                                "type": "string",
-                                "description": "NDEx account password"
-                            },
-                            "is_public": {
-                                "type": "boolean",
-                                "description": "Whether to make the network publicly accessible",
-                                "default": False
-                            },
-                            "network": {
-                                "type": ["string", "integer"],
-                                "description": "Network name or SUID (current network if not specified)"
-                            },
-                            "metadata": {
-                                "type": "object",
-                                "description": "Network metadata (name, description, version, etc.)",
-                                "properties": {
-                                    "name": {"type": "string", "description": "Network name"},
-                                    "description": {"type": "string", "description": "Network description"},
-                                    "version": {"type": "string", "description": "Network version"},
-                                    "author": {"type": "string", "description": "Author name"}
-                                }
-                            },
-                            "ndex_url": {
-                                "type": "string",
-                                "description": "NDEx website URL",
-                                "default": "http://ndexbio.org"
-                            }
-                        },
-                        "required": ["username", "password"]
-                    }
-                ),
-                Tool(
-                    name="get_network_ndex_id",
-                    description="Get the NDEx external ID for a Cytoscape network",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "network": {
-                                "type": ["string", "integer"],
-                                "description": "Network name or SUID (current network if not specified)"
-                            }
-                        },
-                        "required": []
-                    }
-                ),
-                Tool(
-                    name="update_network_in_ndex",
-                    description="Update an existing network in NDEx",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "username": {
-                                "type": "string",
-                                "description": "NDEx account username"
-                            },
-                            "password": {
-                                "type": "string",
-                                "description": "NDEx account password"
-                            },
-                            "is_public": {
-                                "type": "boolean",
-                                "description": "Whether to make the network publicly accessible",
-                                "default": False
-                            },
-                            "network": {
-                                "type": ["string", "integer"],
-                                "description": "Network name or SUID (current network if not specified)"
-                            },
-                            "metadata": {
-                                "type": "object",
-                                "description": "Updated network metadata",
-                                "properties": {
-                                    "name": {"type": "string", "description": "Network name"},
-                                    "description": {"type": "string", "description": "Network description"},
-                                    "version": {"type": "string", "description": "Network version"},
-                                    "author": {"type": "string", "description": "Author name"}
-                                }
-                            },
-                            "ndex_url": {
-                                "type": "string",
-                                "description": "NDEx website URL",
-                                "default": "http://ndexbio.org"
-                            }
-                        },
-                        "required": ["username", "password"]
-                    }
-                )
-            ]
+            return _TOOLS
 
-        @self.server.call_tool()
+        # Arguments are checked against the precompiled _VALIDATORS instead
+        @self.server.call_tool(validate_input=False)
         async def handle_call_tool(name: str, arguments: Dict[str, Any]) -> List[types.TextContent]:
             """Handle tool execution"""
-            logger.debug(f"Received tool call: {name} with arguments: {arguments}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Received tool call: %s with arguments: %s", name, arguments)
             try:
-                if name == "cytoscape_ping":
-                    return await self._ping_cytoscape()
-                elif name == "create_network":
-                    return await self._create_network(**arguments)
-                elif name == "load_network_file":
-                    return await self._load_network_file(**arguments)
-                elif name == "get_network_list":
-                    return await self._get_network_list()
-                elif name == "get_network_info":
-                    return await self._get_network_info(**arguments)
-                elif name == "select_nodes":
-                    return await self._select_nodes(**arguments)
-                elif name == "apply_layout":
-                    return await self._apply_layout(**arguments)
-                elif name == "set_visual_style":
-                    return await self._set_visual_style(**arguments)
-                elif name == "export_image":
-                    return await self._export_image(**arguments)
-                elif name == "run_app_command":
-                    return await self._run_app_command(**arguments)
-                elif name == "load_string_network":
-                    return await self._load_string_network(**arguments)
-                elif name == "import_network_from_ndex":
-                    return await self._import_network_from_ndex(**arguments)
-                elif name == "export_network_to_ndex":
-                    return await self._export_network_to_ndex(**arguments)
-                elif name == "get_network_ndex_id":
-                    return await self._get_network_ndex_id(**arguments)
-                elif name == "update_network_in_ndex":
-                    return await self._update_network_in_ndex(**arguments)
-                else:
+                handler = self._dispatch.get(name)
+                if handler is None:
                     raise ValueError(f"Unknown tool: {name}")
-                    
+                _VALIDATORS[name](arguments)
+                return await handler(**arguments)
+            except fastjsonschema.JsonSchemaException as e:
+                # Raised, not returned, so the SDK flags the reply with isError
+                raise ValueError(f"Input validation error: {e.message}") from e
             except Exception as e:
-                logger.error(f"Error executing tool {name}: {str(e)}")
-                return [TextContent(type="text", text=f"Error: {str(e)}")]
+                logger.error("Error executing tool %s: %s", name, e)
+                return _text(f"Error: {str(e)}")
 
+    @_tool_handler("Cytoscape not accessible")
     async def _ping_cytoscape(self) -> List[TextContent]:
         """Check Cytoscape connectivity"""
-        try:
-            version_info = p4c.cytoscape_version_info()
-            return [TextContent(
-                type="text", 
-                text=f"Cytoscape is running. Version info: {json.dumps(version_info, indent=2)}"
-            )]
-        except Exception as e:
-            return [TextContent(
-                type="text",
-                text=f"Cytoscape not accessible: {str(e)}"
-            )]
+        version_info = self._version_cache.get("version_info")
+        if version_info is None:
+            version_info = await self._run_p4c(p4c.cytoscape_version_info)
+            self._version_cache.set("version_info", version_info)
+        return _const_text(_PING_OK_TEMPLATE.format(_dumps(version_info)))
 
+    @_tool_handler("Failed to create network")
     async def _create_network(self, nodes: List[str], edges: List[List], 
                             title: str = "New Network", collection: str = "My Collection") -> List[TextContent]:
         """Create a new network"""
-        try:
-            import pandas as pd
-            
-            # Format edges for py4cytoscape
-            formatted_edges = []
-            for edge in edges:
-                if len(edge) == 2:
-                    formatted_edges.append([edge[0], edge[1], "interacts"])
-                else:
-                    formatted_edges.append(edge)
-            
-            # Create proper pandas DataFrames
-            nodes_df = pd.DataFrame({'id': nodes})
-            edges_df = pd.DataFrame({
-                'source': [e[0] for e in formatted_edges],
-                'target': [e[1] for e in formatted_edges], 
-                'interaction': [e[2] for e in formatted_edges]
-            })
-            
-            network_suid = p4c.create_network_from_data_frames(
-                nodes=nodes_df,
-                edges=edges_df,
-                title=title,
-                collection=collection
-            )
-            
-            return [TextContent(
-                type="text",
-                text=f"Created network '{title}' with SUID: {network_suid}"
-            )]
-        except Exception as e:
-            return [TextContent(
-                type="text", 
-                text=f"Failed to create network: {str(e)}"
-            )]
+        if len(edges) > BULK_EDGE_THRESHOLD:
+            return await self._create_network_bulk(nodes, edges, title, collection)
+
+        network_suid = await self._run_p4c(_create_from_data_frames, nodes, edges, title, collection)
+        self._network_suids[title] = network_suid
+        self._forget_imports()
+        
+        return _text(f"Created network '{title}' with SUID: {network_suid}")
 
+    async def _create_network_bulk(self, nodes: List[str], edges: List[List],
+                                   title: str, collection: str) -> List[TextContent]:
+        """Create a large network with a single CyREST request"""
+        network_suid = await self._run_p4c(_post_network, nodes, edges, title, collection)
+        self._network_suids[title] = network_suid
+        self._forget_imports()
+
+        return _text(f"Created network '{title}' with SUID: {network_suid}")
+
+    @_tool_handler("Failed to load network file")
     async def _load_network_file(self, file_path: str) -> List[TextContent]:
         """Load network from file
 
         Note: Cytoscape auto-detects file format and handles headers appropriately.
         """
-        try:
-            result = p4c.import_network_from_file(file=file_path)
-            network_suid = result['networks'][0] if result and 'networks' in result and result['networks'] else None
-            
-            return [TextContent(
-                type="text",
-                text=f"Loaded network from {file_path} with SUID: {network_suid}"
-            )]
-        except Exception as e:
-            return [TextContent(
-                type="text",
-                text=f"Failed to load network file: {str(e)}"
-            )]
+        result = await self._run_p4c(p4c.import_network_from_file, file=file_path)
+        network_suid = result['networks'][0] if result and 'networks' in result and result['networks'] else None
+        # The loaded network may take a name that is cached for an older one
+        self._network_suids.clear()
+        self._forget_imports()
+        
+        return _text(f"Loaded network from {file_path} with SUID: {network_suid}")
 
+    @_tool_handler("Failed to get network list")
     async def _get_network_list(self) -> List[TextContent]:
-        """Get list of networks"""
-        try:
-            networks = p4c.get_network_list()
-            return [TextContent(
-                type="text",
-                text=f"Networks: {json.dumps(networks, indent=2)}"
-            )]
-        except Exception as e:
-            return [TextContent(
-                type="text",
-                text=f"Failed to get network list: {str(e)}"
-            )]
+        """Get list of networks
+
+        CyREST already answers with JSON (names and SUIDs), so the body is
+        passed through instead of being parsed and re-serialized.
+        """
+        networks = await self._run_p4c(self._cyrest_get_raw, "networks.names")
+        return _text(f"Networks: {networks}")
 
+    @_tool_handler("Failed to get network info")
     async def _get_network_info(self, network: Optional[Union[str, int]] = None) -> List[TextContent]:
         """Get network information"""
-        try:
-            # Gather network information using available py4cytoscape functions
-            info = {}
-
+        with self._forget_network_on_error(network):
+            # Resolve the SUID first; the remaining lookups only depend on it
             if network:
-                # get_network_suid accepts network name or SUID
-                info['suid'] = p4c.get_network_suid(network=network) if isinstance(network, str) else network
-                info['name'] = p4c.get_network_name(network=info['suid'])
+                suid = await self._resolve_network(network)
             else:
                 # Get current network info
-                info['suid'] = p4c.get_network_suid()
-                info['name'] = p4c.get_network_name()
-
-            info['node_count'] = p4c.get_node_count(network=info['suid'])
-            info['edge_count'] = p4c.get_edge_count(network=info['suid'])
-            info['view_suid'] = p4c.get_network_view_suid(network=info['suid'])
-            
-            return [TextContent(
-                type="text", 
-                text=f"Network info: {json.dumps(info, indent=2)}"
-            )]
-        except Exception as e:
-            return [TextContent(
-                type="text",
-                text=f"Failed to get network info: {str(e)}"
-            )]
+                suid = await self._run_p4c(p4c.get_network_suid)
+
+            name, node_count, edge_count, view_suid = await asyncio.gather(
+                self._run_p4c(p4c.get_network_name, suid=suid),
+                self._run_p4c(p4c.get_node_count, network=suid),
+                self._run_p4c(p4c.get_edge_count, network=suid),
+                self._run_p4c(p4c.get_network_view_suid, network=suid),
+            )
+            info = {
+                'suid': suid,
+                'name': name,
+                'node_count': node_count,
+                'edge_count': edge_count,
+                'view_suid': view_suid,
+            }
 
+            return _text(f"Network info: {_dumps(info)}")
+
+    @_tool_handler("Failed to select nodes")
     async def _select_nodes(self, nodes: List[Union[str, int]], by_col: str = "name",
                           network: Optional[Union[str, int]] = None) -> List[TextContent]:
         """Select nodes in network"""
-        try:
-            kwargs = {"nodes": nodes, "by_col": by_col}
-            if network:
-                kwargs["network"] = network
-                
-            result = p4c.select_nodes(**kwargs)
-            return [TextContent(
-                type="text",
-                text=f"Selected {len(result)} nodes: {result}"
-            )]
-        except Exception as e:
-            return [TextContent(
-                type="text",
-                text=f"Failed to select nodes: {str(e)}"
-            )]
+        with self._forget_network_on_error(network):
+            network = await self._resolve_network(network)
+            if len(nodes) <= SELECT_CHUNK_SIZE:
+                result = await self._run_p4c(p4c.select_nodes, nodes=nodes, by_col=by_col, network=network)
+                return _text(f"Selected {len(result['nodes'])} nodes: {result}")
+
+            # Pin the network so every chunk lands on the same one, then add each
+            # chunk to the selection instead of sending one huge node list
+            if network is None:
+                network = await self._run_p4c(p4c.get_network_suid)
+            chunks = [nodes[i:i + SELECT_CHUNK_SIZE] for i in range(0, len(nodes), SELECT_CHUNK_SIZE)]
+            results = await asyncio.gather(*(
+                self._run_p4c(p4c.select_nodes, nodes=chunk, by_col=by_col,
+                              preserve_current_selection=True, network=network)
+                for chunk in chunks
+            ))
+            result = {'nodes': [], 'edges': []}
+            for chunk_result in results:
+                if chunk_result:
+                    result['nodes'].extend(chunk_result.get('nodes', []))
+                    result['edges'].extend(chunk_result.get('edges', []))
+            return _text(f"Selected {len(result['nodes'])} nodes: {result}")
 
+    @_tool_handler("Failed to apply layout")
     async def _apply_layout(self, layout_name: str = "force-directed", 
                           network: Optional[Union[str, int]] = None) -> List[TextContent]:
         """Apply layout to network"""
-        try:
-            kwargs = {"layout_name": layout_name}
-            if network:
-                kwargs["network"] = network
-                
-            result = p4c.layout_network(**kwargs)
-            return [TextContent(
-                type="text",
-                text=f"Applied layout '{layout_name}': {result}"
-            )]
-        except Exception as e:
-            return [TextContent(
-                type="text", 
-                text=f"Failed to apply layout: {str(e)}"
-            )]
+        if layout_name not in _CORE_LAYOUTS:
+            layout_names = self._version_cache.get("layout_names")
+            if layout_names is None:
+                layout_names = frozenset(await self._run_p4c(p4c.get_layout_names))
+                self._version_cache.set("layout_names", layout_names)
+            if layout_name not in layout_names:
+                return _text(f"Unknown layout: {layout_name}")
+        with self._forget_network_on_error(network):
+            network = await self._resolve_network(network)
+            result = await self._with_progress(
+                self._run_p4c(p4c.layout_network, layout_name=layout_name, network=network)
+            )
+            return _text(f"Applied layout '{layout_name}': {result}")
 
+    @_tool_handler("Failed to set visual style")
     async def _set_visual_style(self, style_name: str, 
                               network: Optional[Union[str, int]] = None) -> List[TextContent]:
         """Set visual style"""
-        try:
-            kwargs = {"style_name": style_name}
-            if network:
-                kwargs["network"] = network
-                
-            result = p4c.set_visual_style(**kwargs)
-            return [TextContent(
-                type="text",
-                text=f"Applied visual style '{style_name}': {result}"
-            )]
-        except Exception as e:
-            return [TextContent(
-                type="text",
-                text=f"Failed to set visual style: {str(e)}"
-            )]
+        with self._forget_network_on_error(network):
+            network = await self._resolve_network(network)
+            result = await self._run_p4c(p4c.set_visual_style, style_name=style_name, network=network)
+            return _text(f"Applied visual style '{style_name}': {result}")
 
+    @_tool_handler("Failed to export image")
     async def _export_image(self, filename: str, type: str = "PNG", resolution: int = 300,
                           network: Optional[Union[str, int]] = None) -> List[TextContent]:
         """Export network image"""
-        try:
-            kwargs = {"filename": filename, "type": type, "resolution": resolution}
-            if network:
-                kwargs["network"] = network
-                
-            result = p4c.export_image(**kwargs)
-            return [TextContent(
-                type="text", 
-                text=f"Exported image to {filename}: {result}"
-            )]
-        except Exception as e:
-            return [TextContent(
-                type="text",
-                text=f"Failed to export image: {str(e)}"
-            )]
+        with self._forget_network_on_error(network):
+            network = await self._resolve_network(network)
+            result = await self._run_p4c(
+                p4c.export_image, filename=filename, type=type, resolution=resolution, network=network
+            )
+            return _text(f"Exported image to {filename}: {result}")
 
+    @_tool_handler("Failed to run command")
     async def _run_app_command(self, command: str, 
                              network: Optional[Union[str, int]] = None) -> List[TextContent]:
         """Run app command"""
-        try:
-            # Note: py4cytoscape commands_run doesn't take network parameter, it's in the command string
-            result = p4c.commands_run(cmd_string=command)
-            return [TextContent(
-                type="text",
-                text=f"Command result: {json.dumps(result, indent=2)}"
-            )]
-        except Exception as e:
-            return [TextContent(
-                type="text",
-                text=f"Failed to run command: {str(e)}"
-            )]
+        # Note: py4cytoscape commands_run doesn't take network parameter, it's in the command string
+        commands = [line.strip() for line in command.splitlines() if line.strip()]
+        if len(commands) > 1:
+            # Run the whole batch in one worker job, in order
+            result = await self._run_p4c(_commands_run_all, commands)
+        else:
+            result = await self._run_p4c(p4c.commands_run, cmd_string=command)
+        # Commands can rename or destroy networks, so cached lookups may be stale
+        self._forget_networks()
+        return _text(f"Command result: {await self._dumps_async(result)}")
 
+    @_tool_handler(
+        "Failed to load STRING network",
+        hint="\nNote: Ensure the stringApp is installed in Cytoscape "
+             "(Apps -> App Manager -> Install Apps -> stringApp)"
+    )
     async def _load_string_network(self, protein_query: str, species: int = 9606,
                                  confidence_score: float = 0.4, network_type: str = "functional") -> List[TextContent]:
         """Load STRING protein network
@@ -675,135 +1064,143 @@ class CytoscapeMCPServer:
         Note: This requires the stringApp to be installed in Cytoscape.
         Uses the STRING database protein query command via CyREST.
         """
-        try:
-            # Build STRING protein query command
-            # STRING uses 'full' for functional networks and 'physical' for physical networks
-            string_network_type = "full" if network_type == "functional" else "physical"
+        cache_key = (protein_query, species, confidence_score, network_type)
+        cached = self._string_cache.get(cache_key)
+        if cached is not None:
+            network_suid, text = cached
+            if await self._network_exists(network_suid):
+                return _text(text)
 
-            # Construct the command string for STRING app
-            string_cmd = f'string protein query query="{protein_query}" species={species} cutoff={confidence_score} networkType={string_network_type}'
+        # Build STRING protein query command
+        # STRING uses 'full' for functional networks and 'physical' for physical networks
+        string_network_type = "full" if network_type == "functional" else "physical"
 
-            # Execute the STRING command via CyREST
-            result = p4c.commands_run(cmd_string=string_cmd)
+        # Construct the command string for STRING app
+        string_cmd = f'string protein query query="{protein_query}" species={species} cutoff={confidence_score} networkType={string_network_type}'
 
-            return [TextContent(
-                type="text",
-                text=f"Loaded STRING network for proteins: {protein_query}\nSpecies: {species}\nConfidence: {confidence_score}\nType: {network_type}\nResult: {json.dumps(result, indent=2) if result else 'Success'}"
-            )]
-        except Exception as e:
-            return [TextContent(
-                type="text",
-                text=f"Failed to load STRING network: {str(e)}\nNote: Ensure the stringApp is installed in Cytoscape (Apps -> App Manager -> Install Apps -> stringApp)"
-            )]
+        # Execute the STRING command via CyREST
+        result = await self._with_progress(self._run_p4c(p4c.commands_run, cmd_string=string_cmd))
+
+        text = f"Loaded STRING network for proteins: {protein_query}\nSpecies: {species}\nConfidence: {confidence_score}\nType: {network_type}\nResult: {_dumps(result) if result else 'Success'}"
+        # stringApp makes the new network current
+        network_suid = await self._run_p4c(p4c.get_network_suid)
+        self._string_cache.set(cache_key, (network_suid, text))
+        return _text(text)
 
+    @_tool_handler("Failed to import from NDEx",
+                   success="Imported network from NDEx ID '{ndex_id}' with SUID: {result}")
     async def _import_network_from_ndex(self, ndex_id: str, username: Optional[str] = None,
                                       password: Optional[str] = None, access_key: Optional[str] = None,
-                                      ndex_url: str = "http://ndexbio.org") -> List[TextContent]:
+                                      ndex_url: str = "http://ndexbio.org") -> int:
         """Import network from NDEx"""
-        try:
-            kwargs = {"ndex_id": ndex_id, "ndex_url": ndex_url}
-            if username and password:
-                kwargs.update({"username": username, "password": password})
-            elif access_key:
-                kwargs["access_key"] = access_key
-                
-            network_suid = p4c.import_network_from_ndex(**kwargs)
-            return [TextContent(
-                type="text",
-                text=f"Imported network from NDEx ID '{ndex_id}' with SUID: {network_suid}"
-            )]
-        except Exception as e:
-            return [TextContent(
-                type="text",
-                text=f"Failed to import from NDEx: {str(e)}"
-            )]
+        if username and password:
+            params = _NdexImportParams(ndex_id, ndex_url, username=username, password=password)
+        else:
+            params = _NdexImportParams(ndex_id, ndex_url, access_key=access_key)
+
+        network_suid: Optional[int] = self._ndex_cache.get((ndex_id, ndex_url))
+        if network_suid is None or not await self._network_exists(network_suid):
+            network_suid = await self._with_progress(
+                self._run_p4c(p4c.import_network_from_ndex, **params.kwargs())
+            )
+            self._ndex_cache.set((ndex_id, ndex_url), network_suid)
+        self._ndex_ids[network_suid] = ndex_id
+        return network_suid
 
+    @_tool_handler("Failed to export to NDEx", success="Exported network to NDEx with ID: {result}")
     async def _export_network_to_ndex(self, username: str, password: str, is_public: bool = False,
                                     network: Optional[Union[str, int]] = None, metadata: Optional[Dict] = None,
-                                    ndex_url: str = "http://ndexbio.org") -> List[TextContent]:
+                                    ndex_url: str = "http://ndexbio.org") -> str:
         """Export network to NDEx"""
-        try:
-            kwargs = {
-                "username": username,
-                "password": password,
-                "isPublic": is_public,  # Note: py4cytoscape uses camelCase
-                "ndex_url": ndex_url
-            }
-            if network:
-                kwargs["network"] = network
-            if metadata:
-                kwargs["metadata"] = metadata
-
-            ndex_id = p4c.export_network_to_ndex(**kwargs)
-            return [TextContent(
-                type="text",
-                text=f"Exported network to NDEx with ID: {ndex_id}"
-            )]
-        except Exception as e:
-            return [TextContent(
-                type="text",
-                text=f"Failed to export to NDEx: {str(e)}"
-            )]
+        with self._forget_network_on_error(network):
+            network = await self._resolve_network(network)
+            ndex_id: str = await self._run_p4c(
+                p4c.export_network_to_ndex,
+                username=username,
+                password=password,
+                is_public=is_public,
+                network=network,
+                metadata=metadata,
+                ndex_url=ndex_url
+            )
+            if isinstance(network, int):
+                self._ndex_ids[network] = ndex_id
+            return ndex_id
 
+    @_tool_handler("Failed to get NDEx ID")
     async def _get_network_ndex_id(self, network: Optional[Union[str, int]] = None) -> List[TextContent]:
-        """Get network NDEx ID"""
-        try:
-            kwargs = {}
-            if network:
-                kwargs["network"] = network
-                
-            ndex_id = p4c.get_network_ndex_id(**kwargs)
+        """Get network NDEx ID
+
+        Lookups by name or SUID are cached; the current network can change
+        between calls, so it is always asked for.
+        """
+        with self._forget_network_on_error(network):
+            network = await self._resolve_network(network)
+            if isinstance(network, int) and network in self._ndex_ids:
+                ndex_id = self._ndex_ids[network]
+            else:
+                ndex_id = await self._run_p4c(p4c.get_network_ndex_id, network=network)
+                if isinstance(network, int):
+                    self._ndex_ids[network] = ndex_id
             if ndex_id:
-                return [TextContent(
-                    type="text",
-                    text=f"Network NDEx ID: {ndex_id}"
-                )]
+                return _text(f"Network NDEx ID: {ndex_id}")
             else:
-                return [TextContent(
-                    type="text",
-                    text="Network is not associated with any NDEx entry"
-                )]
-        except Exception as e:
-            return [TextContent(
-                type="text",
-                text=f"Failed to get NDEx ID: {str(e)}"
-            )]
+                return _const_text("Network is not associated with any NDEx entry")
 
+    @_tool_handler("Failed to update network in NDEx")
     async def _update_network_in_ndex(self, username: str, password: str, is_public: bool = False,
                                     network: Optional[Union[str, int]] = None, metadata: Optional[Dict] = None,
                                     ndex_url: str = "http://ndexbio.org") -> List[TextContent]:
         """Update existing network in NDEx"""
+        with self._forget_network_on_error(network):
+            network = await self._resolve_network(network)
+            result = await self._run_p4c(
+                p4c.update_network_in_ndex,
+                username=username,
+                password=password,
+                is_public=is_public,
+                network=network,
+                metadata=metadata,
+                ndex_url=ndex_url
+            )
+            if isinstance(network, int) and isinstance(result, str):
+                self._ndex_ids[network] = result
+            return _chunked_text("Updated network in NDEx:", result)
+
+    @_tool_handler("Failed to clear NDEx cache")
+    async def _invalidate_ndex_cache(self) -> List[TextContent]:
+        """Forget cached NDEx IDs and NDEx imports"""
+        self._ndex_ids.clear()
+        self._ndex_cache.clear()
+        return _const_text("Cleared NDEx cache")
+
+    async def _warmup_ping(self) -> None:
+        """Import py4cytoscape and check the Cytoscape connection in the background
+
+        The answer also warms the version cache so the client's first ping
+        needs no round-trip.
+        """
         try:
-            kwargs = {
-                "username": username,
-                "password": password,
-                "isPublic": is_public,  # Note: py4cytoscape uses camelCase
-                "ndex_url": ndex_url
-            }
-            if network:
-                kwargs["network"] = network
-            if metadata:
-                kwargs["metadata"] = metadata
-
-            result = p4c.update_network_in_ndex(**kwargs)
-            return [TextContent(
-                type="text",
-                text=f"Updated network in NDEx: {json.dumps(result, indent=2)}"
-            )]
+            # Look the function up in the worker too: the first attribute
+            # access imports py4cytoscape, which must not block the loop
+            version_info = await self._run_p4c(lambda: p4c.cytoscape_version_info())
+            self._version_cache.set("version_info", version_info)
+            logger.debug("py4cytoscape version: %s", getattr(p4c, "__version__", "unknown"))
+            logger.info("Cytoscape connection test successful: %s", version_info)
         except Exception as e:
-            return [TextContent(
-                type="text",
-                text=f"Failed to update network in NDEx: {str(e)}"
-            )]
+            logger.warning("Cytoscape connection test failed: %s", e)
+            logger.warning("Make sure Cytoscape Desktop is running")
 
     async def run(self):
         """Run the MCP server"""
         from mcp.server.stdio import stdio_server
         
-        logger.info("Setting up stdio server...")
+        logger.debug("Setting up stdio server...")
+        # Serve list_tools right away; the connection check finishes on its own
+        warmup = asyncio.ensure_future(self._warmup_ping())
         try:
             async with stdio_server() as (read_stream, write_stream):
-                logger.info("Stdio server established, starting MCP server...")
+                logger.debug("Stdio server established, starting MCP server...")
                 logger.debug("About to call server.run()")
                 await self.server.run(
                     read_stream,
@@ -819,46 +1216,43 @@ class CytoscapeMCPServer:
                 )
                 logger.info("MCP server run completed")
         except Exception as e:
-            logger.error(f"Error in server run: {e}")
+            logger.error("Error in server run: %s", e)
             logger.error("Stack trace:", exc_info=True)
             raise
+        finally:
+            warmup.cancel()
+            self._cyrest_pool.shutdown(wait=False)
 
 def main():
     """Main entry point"""
     try:
         logger.info("Starting Cytoscape MCP Server...")
-        logger.info(f"Python version: {sys.version}")
-        logger.info(f"py4cytoscape version: {p4c.__version__ if hasattr(p4c, '__version__') else 'unknown'}")
-        
-        # Test Cytoscape connection at startup
-        try:
-            result = p4c.cytoscape_ping()
-            logger.info(f"Cytoscape connection test successful: {result}")
-        except Exception as e:
-            logger.warning(f"Cytoscape connection test failed: {e}")
-            logger.warning("Make sure Cytoscape Desktop is running")
-        
+        logger.debug("Python version: %s", sys.version)
+
+        if importlib.util.find_spec("py4cytoscape") is None:
+            print("Error: py4cytoscape not installed. Install with: pip install py4cytoscape", file=sys.stderr)
+            sys.exit(1)
+
         server = CytoscapeMCPServer()
-        logger.info("Server initialized, starting event loop...")
-        
-        # Flush logs before starting server
-        for handler in logger.handlers:
-            if hasattr(handler, 'flush'):
-                handler.flush()
-        
-        asyncio.run(server.run())
+        logger.debug("Server initialized, starting event loop...")
+
+        try:
+            # libuv-based event loop; lower per-call overhead than the stdlib
+            # loop. uvloop.run only exists from uvloop 0.18
+            from uvloop import run as run_loop
+        except ImportError:
+            run_loop = asyncio.run
+        run_loop(server.run())
         logger.info("Server exited normally")
         
     except KeyboardInterrupt:
         logger.info("Server interrupted by user")
     except Exception as e:
-        logger.error(f"Failed to start server: {e}")
+        logger.error("Failed to start server: %s", e)
         logger.error("Stack trace:", exc_info=True)
-        # Flush logs before exiting
-        for handler in logger.handlers:
-            if hasattr(handler, 'flush'):
-                handler.flush()
         sys.exit(1)
+    finally:
+        _stop_log_listener()
 
 if __name__ == "__main__":
     main()
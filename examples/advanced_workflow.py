@@ -3,17 +3,32 @@ Example: Advanced Network Analysis Workflow
 
 This example demonstrates a more complex workflow involving
 data integration, analysis, and visualization.
+
+Run it from the repository root with ``python -m examples.advanced_workflow``.
 """
 
 import asyncio
 from cytoscape_mcp.server import CytoscapeMCPServer
+from examples.basic_usage import run_step
+
+# Maximum number of tool calls an example keeps in flight at once
+MAX_CONCURRENT_CALLS = 8
+
+
+async def gather_limited(*coros, limit=MAX_CONCURRENT_CALLS):
+    """Run independent tool calls concurrently, at most `limit` at a time"""
+    sem = asyncio.Semaphore(limit)
+
+    async def limited(coro):
+        async with sem:
+            return await coro
 
+    return await asyncio.gather(*(limited(coro) for coro in coros))
 
-async def pathway_analysis_workflow():
+
+async def pathway_analysis_workflow(server):
     """Complete pathway analysis workflow"""
     
-    server = CytoscapeMCPServer()
-    
     print("=== Advanced Pathway Analysis Workflow ===\n")
     
     # 1. Load pathway from STRING
@@ -29,29 +44,31 @@ async def pathway_analysis_workflow():
         )
         print(f"   {result[0].text}\n")
         
-        # 2. Apply layout optimized for biological networks
+        # 2 + 3. Layout and statistics don't depend on each other, so run them together
+        layout_result, info_result = await gather_limited(
+            server._apply_layout("organic"),
+            server._get_network_info()
+        )
         print("2. Applying organic layout...")
-        result = await server._apply_layout("organic")
-        print(f"   {result[0].text}\n")
-        
-        # 3. Get network statistics
+        print(f"   {layout_result[0].text}\n")
         print("3. Getting network information...")
-        result = await server._get_network_info()
-        print(f"   {result[0].text}\n")
+        print(f"   {info_result[0].text}\n")
         
         # 4. Focus on core tumor suppressors
-        print("4. Selecting key tumor suppressor genes...")
-        result = await server._select_nodes(["TP53", "RB1", "APC", "BRCA1"])
-        print(f"   {result[0].text}\n")
+        await run_step(
+            "4. Selecting key tumor suppressor genes...",
+            server._select_nodes(["TP53", "RB1", "APC", "BRCA1"])
+        )
         
         # 5. Export high-resolution figure
-        print("5. Exporting publication-quality figure...")
-        result = await server._export_image(
-            filename="cancer_pathway.pdf",
-            type="PDF",
-            resolution=600
+        await run_step(
+            "5. Exporting publication-quality figure...",
+            server._export_image(
+                filename="cancer_pathway.pdf",
+                type="PDF",
+                resolution=600
+            )
         )
-        print(f"   {result[0].text}\n")
         
         # 6. Execute clustering analysis (example command)
         print("6. Running network clustering analysis...")
@@ -64,16 +81,13 @@ async def pathway_analysis_workflow():
         print("   Make sure Cytoscape is running and connected to the internet.\n")
 
 
-async def multi_network_comparison():
+async def multi_network_comparison(server):
     """Compare multiple networks side by side"""
     
-    server = CytoscapeMCPServer()
-    
     print("=== Multi-Network Comparison ===\n")
     
     try:
-        # Create first network - cell cycle
-        print("1. Creating cell cycle network...")
+        # 1 + 2. The two networks are independent, so create them together
         cell_cycle_nodes = ["CDK1", "CDK2", "CCNA2", "CCNB1", "RB1", "E2F1"]
         cell_cycle_edges = [
             ["CDK1", "CCNB1", "binds"],
@@ -81,21 +95,6 @@ async def multi_network_comparison():
             ["RB1", "E2F1", "inhibits"],
             ["CDK2", "RB1", "phosphorylates"]
         ]
-        
-        result = await server._create_network(
-            nodes=cell_cycle_nodes,
-            edges=cell_cycle_edges,
-            title="Cell Cycle Network",
-            collection="Comparison Study"
-        )
-        print(f"   {result[0].text}\n")
-        
-        # Apply layout to first network
-        result = await server._apply_layout("hierarchical")
-        print(f"   Applied layout to cell cycle network\n")
-        
-        # Create second network - apoptosis
-        print("2. Creating apoptosis network...")
         apoptosis_nodes = ["TP53", "BAX", "BCL2", "CASP3", "CASP9", "APAF1"]
         apoptosis_edges = [
             ["TP53", "BAX", "activates"],
@@ -104,28 +103,43 @@ async def multi_network_comparison():
             ["CASP9", "CASP3", "activates"]
         ]
         
-        result = await server._create_network(
-            nodes=apoptosis_nodes,
-            edges=apoptosis_edges,
-            title="Apoptosis Network",
-            collection="Comparison Study"
+        cell_cycle_result, apoptosis_result = await gather_limited(
+            server._create_network(
+                nodes=cell_cycle_nodes,
+                edges=cell_cycle_edges,
+                title="Cell Cycle Network",
+                collection="Comparison Study"
+            ),
+            server._create_network(
+                nodes=apoptosis_nodes,
+                edges=apoptosis_edges,
+                title="Apoptosis Network",
+                collection="Comparison Study"
+            ),
+            limit=4
+        )
+        print("1. Creating cell cycle network...")
+        print(f"   {cell_cycle_result[0].text}\n")
+        print("2. Creating apoptosis network...")
+        print(f"   {apoptosis_result[0].text}\n")
+        
+        # The layout depends only on the cell cycle network being created;
+        # name it, since either network may be current now
+        await run_step(
+            "3. Applying hierarchical layout to the cell cycle network...",
+            server._apply_layout("hierarchical", network="Cell Cycle Network")
         )
-        print(f"   {result[0].text}\n")
         
         # Get list of all networks
-        print("3. Listing all networks in session...")
-        result = await server._get_network_list()
-        print(f"   {result[0].text}\n")
+        await run_step("4. Listing all networks in session...", server._get_network_list())
         
     except Exception as e:
         print(f"   Error in comparison: {e}\n")
 
 
-async def data_integration_example():
+async def data_integration_example(server):
     """Integrate external data with network"""
     
-    server = CytoscapeMCPServer()
-    
     print("=== Data Integration Example ===\n")
     
     try:
@@ -156,9 +170,10 @@ async def data_integration_example():
         print("   - Apply color/size mappings based on data\n")
         
         # Apply a layout suitable for data visualization
-        print("3. Applying force-directed layout...")
-        result = await server._apply_layout("force-directed")
-        print(f"   {result[0].text}\n")
+        await run_step(
+            "3. Applying force-directed layout...",
+            server._apply_layout("force-directed")
+        )
         
     except Exception as e:
         print(f"   Error in data integration: {e}\n")
@@ -166,10 +181,13 @@ async def data_integration_example():
 
 async def run_advanced_examples():
     """Run all advanced examples"""
+    # The workflows refer to networks they created earlier by name, so they
+    # share one server, which remembers each name's SUID between workflows
+    server = CytoscapeMCPServer()
     try:
-        await pathway_analysis_workflow()
-        await multi_network_comparison()
-        await data_integration_example()
+        await pathway_analysis_workflow(server)
+        await multi_network_comparison(server)
+        await data_integration_example(server)
         
         print("=== Advanced Examples Completed ===")
         print("These examples demonstrate complex workflows possible")
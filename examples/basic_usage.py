@@ -6,22 +6,27 @@ and exporting visualizations using the Cytoscape MCP server.
 """
 
 import asyncio
-import json
+import sys
 from cytoscape_mcp.server import CytoscapeMCPServer
 
 
-async def basic_network_example():
+async def run_step(label, call):
+    """Await a tool call, then print the step label and the tool's reply
+
+    Shared with the other example modules.
+    """
+    result = await call
+    sys.stdout.write(f"{label}\n   {result[0].text}\n\n")
+    return result
+
+
+async def basic_network_example(server):
     """Create and visualize a basic network"""
     
-    # Initialize server (normally this would be handled by MCP framework)
-    server = CytoscapeMCPServer()
-    
     print("=== Basic Network Creation Example ===\n")
     
     # 1. Check Cytoscape connectivity
-    print("1. Checking Cytoscape connectivity...")
-    result = await server._ping_cytoscape()
-    print(f"   {result[0].text}\n")
+    await run_step("1. Checking Cytoscape connectivity...", server._ping_cytoscape())
     
     # 2. Create a simple network
     print("2. Creating a simple network...")
@@ -42,18 +47,17 @@ async def basic_network_example():
     print(f"   {result[0].text}\n")
     
     # 3. Apply a layout
-    print("3. Applying force-directed layout...")
-    result = await server._apply_layout("force-directed")
-    print(f"   {result[0].text}\n")
+    await run_step("3. Applying force-directed layout...", server._apply_layout("force-directed"))
     
     # 4. Export as image
-    print("4. Exporting network image...")
-    result = await server._export_image(
-        filename="gene_network.png",
-        type="PNG",
-        resolution=300
+    await run_step(
+        "4. Exporting network image...",
+        server._export_image(
+            filename="gene_network.png",
+            type="PNG",
+            resolution=300
+        )
     )
-    print(f"   {result[0].text}\n")
     
     # 5. Get network information
     print("5. Getting network information...")
@@ -61,39 +65,32 @@ async def basic_network_example():
     print(f"   Network details: {result[0].text}\n")
 
 
-async def string_network_example():
+async def string_network_example(server):
     """Load and analyze a protein network from STRING"""
     
-    server = CytoscapeMCPServer()
-    
     print("=== STRING Network Example ===\n")
     
     # 1. Load protein interaction network from STRING
-    print("1. Loading protein network from STRING database...")
-    result = await server._load_string_network(
-        protein_query="TP53,MDM2,CDKN1A,ATM",
-        species=9606,  # Human
-        confidence_score=0.7,
-        network_type="functional"
+    await run_step(
+        "1. Loading protein network from STRING database...",
+        server._load_string_network(
+            protein_query="TP53,MDM2,CDKN1A,ATM",
+            species=9606,  # Human
+            confidence_score=0.7,
+            network_type="functional"
+        )
     )
-    print(f"   {result[0].text}\n")
     
     # 2. Apply biological layout
-    print("2. Applying hierarchical layout...")
-    result = await server._apply_layout("hierarchical")
-    print(f"   {result[0].text}\n")
+    await run_step("2. Applying hierarchical layout...", server._apply_layout("hierarchical"))
     
     # 3. Select specific nodes
-    print("3. Selecting TP53 and MDM2 nodes...")
-    result = await server._select_nodes(["TP53", "MDM2"])
-    print(f"   {result[0].text}\n")
+    await run_step("3. Selecting TP53 and MDM2 nodes...", server._select_nodes(["TP53", "MDM2"]))
 
 
-async def ndex_workflow_example():
+async def ndex_workflow_example(server):
     """Demonstrate NDEx import/export workflow"""
     
-    server = CytoscapeMCPServer()
-    
     print("=== NDEx Workflow Example ===\n")
     
     # Note: This example uses placeholder credentials
@@ -113,23 +110,22 @@ async def ndex_workflow_example():
     
     # Commented out to avoid requiring real credentials
     """
-    print("2. Exporting network to NDEx...")
-    result = await server._export_network_to_ndex(
-        username="your_username",
-        password="your_password",
-        is_public=False,
-        metadata={
-            "name": "Research Network",
-            "description": "Example network for research",
-            "version": "1.0",
-            "author": "Researcher"
-        }
+    await run_step(
+        "2. Exporting network to NDEx...",
+        server._export_network_to_ndex(
+            username="your_username",
+            password="your_password",
+            is_public=False,
+            metadata={
+                "name": "Research Network",
+                "description": "Example network for research",
+                "version": "1.0",
+                "author": "Researcher"
+            }
+        )
     )
-    print(f"   {result[0].text}\n")
     
-    print("3. Getting NDEx ID...")
-    result = await server._get_network_ndex_id()
-    print(f"   {result[0].text}\n")
+    await run_step("3. Getting NDEx ID...", server._get_network_ndex_id())
     """
     
     print("2. For NDEx operations, you would use real credentials like:")
@@ -138,11 +134,9 @@ async def ndex_workflow_example():
     print("   or access_key='your_api_key'\n")
 
 
-async def file_import_example():
+async def file_import_example(server):
     """Demonstrate importing networks from files"""
     
-    server = CytoscapeMCPServer()
-    
     print("=== File Import Example ===\n")
     
     print("This example shows how to import network files.")
@@ -153,22 +147,26 @@ async def file_import_example():
     
     # Example with a hypothetical file
     """
-    print("1. Importing SIF file...")
-    result = await server._load_network_file(
-        file_path="/path/to/network.sif",
-        first_row_as_column_names=True
+    await run_step(
+        "1. Importing SIF file...",
+        server._load_network_file(
+            file_path="/path/to/network.sif",
+            first_row_as_column_names=True
+        )
     )
-    print(f"   {result[0].text}\n")
     """
 
 
 async def run_all_examples():
     """Run all examples"""
+    # Each example works on whatever network is current, so they run in
+    # order on one server and reuse its CyREST connections
+    server = CytoscapeMCPServer()
     try:
-        await basic_network_example()
-        await string_network_example() 
-        await ndex_workflow_example()
-        await file_import_example()
+        await basic_network_example(server)
+        await string_network_example(server)
+        await ndex_workflow_example(server)
+        await file_import_example(server)
         
         print("=== All Examples Completed ===")
         print("Note: Some examples require Cytoscape to be running")
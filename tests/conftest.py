@@ -5,8 +5,17 @@ Test fixtures and utilities for Cytoscape MCP tests
 import pytest
 import tempfile
 import os
+import shutil
+import atexit
 from pathlib import Path
 
+# py4cytoscape writes its log files under the working directory when it is
+# imported; send them to a throwaway directory instead, as the wrapper script does
+_P4C_LOG_DIR = tempfile.mkdtemp(prefix="py4cytoscape-logs-")
+os.environ.setdefault("PY4CYTOSCAPE_DETAIL_LOGGER_DIR", _P4C_LOG_DIR)
+os.environ.setdefault("PY4CYTOSCAPE_SUMMARY_LOGGER_DIR", _P4C_LOG_DIR)
+atexit.register(shutil.rmtree, _P4C_LOG_DIR, ignore_errors=True)
+
 
 @pytest.fixture
 def temp_network_file():